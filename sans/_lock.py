@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import logging
 import threading
 import time
 import weakref
 from collections import deque
 from contextvars import Context, copy_context
 from functools import partial
-from operator import add
 from typing import TYPE_CHECKING, Any, Awaitable, Callable
 
 import anyio
@@ -20,6 +21,7 @@ if TYPE_CHECKING:
     _Ts = TypeVarTuple("_Ts")
 
 __all__ = ["ResetLock"]
+LOG = logging.getLogger(__name__)
 
 
 def _threading_sleep_forever(callback_deque: deque[Callable[[], Any]]):
@@ -68,30 +70,92 @@ else:
             callback_deque.remove(release)
 
 
-class _ThreadTimer(threading.Timer):
+class _TimerHandle:
+    __slots__ = ("when", "cancelled", "_callback", "_args", "_context")
+
     def __init__(
         self,
-        delay: float,
+        when: float,
         callback: Callable[[Unpack[_Ts]], Any],
-        *args: Unpack[_Ts],
-        context: Context | None = None,
+        args: tuple[Unpack[_Ts]],
+        context: Context,
     ) -> None:
-        if not context:
-            context = copy_context()
-        super().__init__(delay, context.run, (callback, *args))
+        self.when = when
+        self.cancelled = False
+        self._callback = callback
+        self._args = args
+        self._context = context
+
+    def __lt__(self, other: _TimerHandle) -> bool:
+        return self.when < other.when
 
-    def when(self) -> float:
-        # when the timer completes if started at this very moment
-        return self.interval + time.monotonic()
+    def cancel(self) -> None:
+        self.cancelled = True
 
-    def run(self) -> None:
-        # freeze .when() at the current time
-        self.when = partial(add, self.interval, time.monotonic())
+    def _run(self) -> None:
         try:
-            return super().run()
+            self._context.run(self._callback, *self._args)
         finally:
-            self.when = time.monotonic
-            del self.function, self.args, self.kwargs
+            del self._callback, self._args, self._context
+
+
+class _Scheduler:
+    """
+    Runs delayed callbacks from a single shared daemon thread,
+    rather than spawning a :class:`threading.Timer` for each one.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition(threading.Lock())
+        self._heap: list[_TimerHandle] = []
+        self._thread: threading.Thread | None = None
+
+    def call_later(
+        self,
+        delay: float,
+        callback: Callable[[Unpack[_Ts]], Any],
+        *args: Unpack[_Ts],
+        context: Context | None = None,
+    ) -> _TimerHandle:
+        if not context:
+            context = copy_context()
+        handle = _TimerHandle(time.monotonic() + delay, callback, args, context)
+        with self._cond:
+            heapq.heappush(self._heap, handle)
+            if not self._thread or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name=f"{__name__}._scheduler", daemon=True
+                )
+                self._thread.start()
+            else:
+                self._cond.notify()
+        return handle
+
+    def _run(self) -> None:
+        cond = self._cond
+        heap = self._heap
+        with cond:
+            while True:
+                while heap and heap[0].cancelled:
+                    heapq.heappop(heap)
+                if not heap:
+                    cond.wait()
+                    continue
+                delay = heap[0].when - time.monotonic()
+                if delay > 0:
+                    cond.wait(delay)
+                    continue
+                handle = heapq.heappop(heap)
+                cond.release()
+                try:
+                    handle._run()
+                except Exception:
+                    LOG.exception("Exception in scheduled callback")
+                finally:
+                    cond.acquire()
+
+
+_scheduler = _Scheduler()
 
 
 # I would love to make this utilize a semaphore instead
@@ -113,7 +177,7 @@ class ResetLock:
     using :class:`RateLimiter` will manage a global lock for you.
     """
 
-    __deferred: _ThreadTimer | None = None
+    __deferred: _TimerHandle | None = None
 
     def __finalizer(self) -> None:
         pass
@@ -123,12 +187,14 @@ class ResetLock:
         self._waiters: deque[Callable[[], Any]] = deque()
 
     def _wake_up_next(self):
-        try:
-            release = next(iter(self._waiters))
-        except StopIteration:
+        waiters = self._waiters
+        if not waiters:
             return
-        else:
-            release()
+        try:
+            release = waiters[0]
+        except IndexError:
+            return  # emptied by another thread in the meantime
+        release()
 
     async def __aenter__(self) -> None:
         acquire = self._lock.acquire
@@ -169,18 +235,17 @@ class ResetLock:
     @property
     def deferred(self) -> float | None:
         if self.__deferred:
-            return time.monotonic() - self.__deferred.when()
+            return self.__deferred.when - time.monotonic()
         # return None
 
     _deferred = property(deferred.fget)
 
     @_deferred.setter
-    def _deferred(self, value: _ThreadTimer):
+    def _deferred(self, value: _TimerHandle):
         assert self.locked()
         self.__finalizer()
-        value.start()
         self.__deferred = value
-        self.__finalizer = weakref.finalize(self, value.finished.set)
+        self.__finalizer = weakref.finalize(self, value.cancel)
 
     @_deferred.deleter
     def _deferred(self) -> None:
@@ -191,7 +256,7 @@ class ResetLock:
     def defer(self, delay: float) -> None:
         if not self.locked():
             return
-        self._deferred = _ThreadTimer(delay, self._release)
+        self._deferred = _scheduler.call_later(delay, self._release)
 
     def locked(self):
         return self._lock.locked()
@@ -1,17 +1,13 @@
 from __future__ import annotations
 
-import codecs
-import zlib
-from functools import reduce
 from typing import Iterable
-from xml.etree.ElementTree import Element, XMLParser, XMLPullParser
+from xml.etree.ElementTree import Element, TreeBuilder, XMLParser, XMLPullParser
 
-
-def _reducer(final: bool):
-    def inner(data: bytes, decoder: codecs.IncrementalDecoder) -> bytes:
-        return decoder.decode(data, final)  # type: ignore
-
-    return inner
+try:
+    # ISA-L's drop-in zlib replacement is several times faster at gunzipping
+    from isal import isal_zlib as zlib
+except ImportError:
+    import zlib
 
 
 class GZipDecoder:
@@ -38,22 +34,20 @@ class XMLDecoder:
 
 class XMLChunker:
     def __init__(self, *, encoding: str | None = None) -> None:
-        self._decoder_chain: list[codecs.IncrementalDecoder] = []
-        if encoding:
-            self._decoder_chain.append(
-                codecs.getincrementaldecoder(encoding)("replace")
-            )
-        self._pull_parser = XMLPullParser(["start", "end"])
+        # Feed bytes straight to expat, which decodes them in C.
+        # _parser is a private stdlib argument; ElementTree.iterparse passes
+        # its own XMLParser through it the same way to override the encoding.
+        self._pull_parser = XMLPullParser(
+            ["start", "end"],
+            _parser=XMLParser(target=TreeBuilder(), encoding=encoding),
+        )
         self._path: list[Element] = []
 
     def decode(self, data: bytes) -> Iterable[Element]:
-        data = reduce(_reducer(False), self._decoder_chain, data)
         self._pull_parser.feed(data)
         return self._read_events()
 
     def flush(self) -> Iterable[Element]:
-        data = reduce(_reducer(True), self._decoder_chain, b"")
-        self._pull_parser.feed(data)
         self._pull_parser.close()
         return self._read_events()
 
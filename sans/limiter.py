@@ -4,6 +4,8 @@ import logging
 import time
 import warnings
 from contextlib import AsyncExitStack, ExitStack
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from itertools import count, repeat, starmap
 from math import ldexp
 from random import random
@@ -31,6 +33,9 @@ if TYPE_CHECKING:
 
 __all__ = ["RateLimiter", "TelegramLimiter"]
 LOG = logging.getLogger(__name__)
+# compared against every request, so only compute these once
+_API_HOST = API_URL.host
+_API_NETLOC = API_URL.netloc.decode("ascii")
 _KT = TypeVar("_KT")
 _T = TypeVar("_T")
 
@@ -42,6 +47,24 @@ def _get_as_int(mapping: Mapping[_KT, Any], key: _KT, default: _T) -> int | _T:
         return default
 
 
+def _get_retry_after(headers: Mapping[str, str]) -> float:
+    # Retry-After may be either delay-seconds or an HTTP-date
+    value = headers.get("Retry-After")
+    if not value:
+        return 0
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0)
+
+
 class _Backoff:
     def __getitem__(self, item: slice) -> Iterator[float]:
         if item.stop is None or item.step == 0:
@@ -54,6 +77,9 @@ class _Backoff:
 
 
 _backoff = _Backoff()
+# upper bound of _backoff[:6]; a 5XX's Retry-After is never allowed past this,
+# since the global lock is held while sleeping
+_MAX_BACKOFF = ldexp(1, 5)
 
 
 # TODO: refactor I/O flows into multiple functions
@@ -85,11 +111,11 @@ class RateLimiter(httpx.Auth):
     def auth_flow(
         self, request: httpx.Request
     ) -> Generator[httpx.Request, httpx.Response, None]:
-        if request.url.host == API_URL.host:
+        if request.url.host == _API_HOST:
             request = self._request_hook(request)
         response = yield request
         response.__class__ = Response
-        if response.url.host == API_URL.host:
+        if response.url.host == _API_HOST:
             self._response_hook(response)
 
     def sync_auth_flow(
@@ -98,9 +124,7 @@ class RateLimiter(httpx.Auth):
         recruitment_delay: int | None = getattr(self, "_recruitment_delay", None)
         is_telegram_limiter = recruitment_delay is not None
         with ExitStack() as lock_stack:
-            if request.headers["Host"] == API_URL.netloc.decode(
-                request.headers.encoding
-            ):
+            if request.headers["Host"] == _API_NETLOC:
                 if is_telegram_limiter:
                     lock_stack.enter_context(TelegramLimiter._lock)
                     if TelegramLimiter._last_request is not None:
@@ -138,9 +162,9 @@ class RateLimiter(httpx.Auth):
                 else:
                     status = _sent.status_code
                     if status == 429:
-                        retry = _get_as_int(_sent.headers, "Retry-After", 0)
+                        retry = _get_retry_after(_sent.headers)
                         if retry:
-                            LOG.info("Ratelimit hit, retrying in %s seconds.", retry)
+                            LOG.info("Ratelimit hit, retrying in %.0f seconds.", retry)
                             remaining = _get_as_int(
                                 _sent.headers, "Ratelimit-Remaining", 0
                             )
@@ -190,6 +214,11 @@ class RateLimiter(httpx.Auth):
                         except StopIteration:
                             pass  # out of retries
                         else:
+                            # don't retry before the server asks us to
+                            retry = max(
+                                retry,
+                                min(_get_retry_after(_sent.headers), _MAX_BACKOFF),
+                            )
                             LOG.debug(
                                 "Status %s received, retrying in %.0f seconds.",
                                 status,
@@ -212,9 +241,7 @@ class RateLimiter(httpx.Auth):
         recruitment_delay: int | None = getattr(self, "_recruitment_delay", None)
         is_telegram_limiter = recruitment_delay is not None
         async with AsyncExitStack() as lock_stack:
-            if request.headers["Host"] == API_URL.netloc.decode(
-                request.headers.encoding
-            ):
+            if request.headers["Host"] == _API_NETLOC:
                 if is_telegram_limiter:
                     await lock_stack.enter_async_context(TelegramLimiter._lock)
                     if TelegramLimiter._last_request is not None:
@@ -252,9 +279,9 @@ class RateLimiter(httpx.Auth):
                 else:
                     status = _sent.status_code
                     if status == 429:
-                        retry = _get_as_int(_sent.headers, "Retry-After", 0)
+                        retry = _get_retry_after(_sent.headers)
                         if retry:
-                            LOG.info("Ratelimit hit, retrying in %s seconds.", retry)
+                            LOG.info("Ratelimit hit, retrying in %.0f seconds.", retry)
                             remaining = _get_as_int(
                                 _sent.headers, "Ratelimit-Remaining", 0
                             )
@@ -306,6 +333,11 @@ class RateLimiter(httpx.Auth):
                         except StopIteration:
                             pass  # out of retries
                         else:
+                            # don't retry before the server asks us to
+                            retry = max(
+                                retry,
+                                min(_get_retry_after(_sent.headers), _MAX_BACKOFF),
+                            )
                             LOG.debug(
                                 "Status %s received, retrying in %.0f seconds.",
                                 status,
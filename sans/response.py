@@ -69,7 +69,8 @@ class Response(httpx.Response):
         return self._xml
 
     def iter_xml(self) -> Iterator[Element]:
-        decoder = XMLChunker(encoding=self.encoding)
+        # only override the XML declaration if the server sent a charset
+        decoder = XMLChunker(encoding=self.charset_encoding)
         chunker = (
             self.iter_gzip()
             if self.content_type.endswith(("/x-gzip", "/gzip"))
@@ -79,7 +80,8 @@ class Response(httpx.Response):
         yield from decoder.flush()
 
     async def aiter_xml(self) -> AsyncIterator[Element]:
-        decoder = XMLChunker(encoding=self.encoding)
+        # only override the XML declaration if the server sent a charset
+        decoder = XMLChunker(encoding=self.charset_encoding)
         chunker = (
             self.aiter_gzip()
             if self.content_type.endswith(("/x-gzip", "/gzip"))
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from datetime import date as _date
+from string import ascii_letters, digits
 from typing import TYPE_CHECKING, Dict, Mapping, NewType
+from urllib.parse import quote_plus
 
 import httpx
 
@@ -11,6 +13,12 @@ if TYPE_CHECKING:
     _Shard = NewType("_Shard", Dict[str, str])
 
 API_URL = httpx.URL("https://www.nationstates.net/cgi-bin/api.cgi")
+# API_URL.copy_with(params=...) round-trips through QueryParams and
+# re-parses every component, so build the query string by hand instead
+_API_QUERY_PREFIX = f"{API_URL}?"
+# characters that quote_plus never escapes
+_SAFE = frozenset(ascii_letters + digits + "_.-~")
+_SAFE_OR_SPACE = _SAFE | {" "}
 
 __all__ = [
     "API_URL",
@@ -27,6 +35,37 @@ __all__ = [
 ]
 
 
+def _quote(value: object) -> str:
+    # format values the same way httpx's QueryParams does
+    if value is True:
+        value = "true"
+    elif value is False:
+        value = "false"
+    elif value is None:
+        value = ""
+    else:
+        value = str(value)
+    # shard names and most values are plain identifiers, which need no escaping
+    if _SAFE.issuperset(value):
+        return value
+    if _SAFE_OR_SPACE.issuperset(value):
+        return value.replace(" ", "+")
+    return quote_plus(value)
+
+
+def _urlencode(query: Mapping[str, object]) -> str:
+    # equivalent to str(httpx.QueryParams(query)), but skips quote_plus
+    # for the common case of values which don't need escaping
+    parts: list[str] = []
+    for key, value in query.items():
+        key = _quote(key)
+        if isinstance(value, (list, tuple)):
+            parts.extend([f"{key}={_quote(item)}" for item in value])
+        else:
+            parts.append(f"{key}={_quote(value)}")
+    return "&".join(parts)
+
+
 def Nation(nation: str, *shards: str | _Shard, **parameters: str) -> httpx.URL:
     return World(*shards, nation=nation, **parameters)
 
@@ -36,20 +75,28 @@ def Region(region: str, *shards: str, **parameters: str) -> httpx.URL:
 
 
 def World(*shards: str | _Shard, **parameters: str) -> httpx.URL:
-    q: list[str | None] = [parameters.pop("q", None)]
+    q: list[str] = []
+    q_param = parameters.pop("q", None)
+    if q_param:
+        q.append(str(q_param))
     query: dict[str, str] = {}
     for shard in shards:
         if isinstance(shard, Mapping):
-            shard = dict(shard)
-            q.append(shard.pop("q", None))
-            query.update(shard)
+            for key, value in shard.items():
+                if key != "q":
+                    query[key] = value
+                elif value:
+                    q.append(str(value))
         else:
-            q.append(str(shard))
-    q_str = " ".join(map(str, filter(None, q)))
-    if q_str:
-        query["q"] = q_str
+            shard = str(shard)
+            if shard:
+                q.append(shard)
+    if q:
+        query["q"] = " ".join(q)
     query.update(parameters)
-    return API_URL.copy_with(params=query)
+    if not query:
+        return API_URL
+    return httpx.URL(_API_QUERY_PREFIX + _urlencode(query))
 
 
 def WA(
@@ -63,7 +110,11 @@ def Command(nation: str, c: str, **parameters: str) -> httpx.URL:
 
 
 def Telegram(client: str, tgid: str, key: str, to: str) -> httpx.URL:
-    return World(a="sendtg", client=client, tgid=tgid, key=key, to=to)
+    # fixed query shape, so skip World()'s shard handling entirely
+    return httpx.URL(
+        f"{_API_QUERY_PREFIX}a=sendtg&client={_quote(client)}"
+        f"&tgid={_quote(tgid)}&key={_quote(key)}&to={_quote(to)}"
+    )
 
 
 def Shard(q: str, **parameters: str) -> _Shard:
@@ -71,23 +122,29 @@ def Shard(q: str, **parameters: str) -> _Shard:
     return parameters  # type: ignore
 
 
+# httpx.URL.join re-parses both URLs, so build the constant ones only once
+_NATIONS_DUMP = API_URL.join("/pages/nations.xml.gz")
+_REGIONS_DUMP = API_URL.join("/pages/regions.xml.gz")
+_CARDS_DUMPS: dict[str, httpx.URL] = {}
+
+
 # https://www.nationstates.net/archive/nations/2018-09-30-nations-xml.gz
 def NationsDump(date: _date | None = None) -> httpx.URL:
     if date:
-        path = date.strftime("/archive/nations/%Y-%m-%d-nations-xml.gz")
-    else:
-        path = "/pages/nations.xml.gz"
-    return API_URL.join(path)
+        return API_URL.join(date.strftime("/archive/nations/%Y-%m-%d-nations-xml.gz"))
+    return _NATIONS_DUMP
 
 
 # https://www.nationstates.net/archive/nations/2018-09-30-regions-xml.gz
 def RegionsDump(date: _date | None = None) -> httpx.URL:
     if date:
-        path = date.strftime("/archive/nations/%Y-%m-%d-regions-xml.gz")
-    else:
-        path = "/pages/regions.xml.gz"
-    return API_URL.join(path)
+        return API_URL.join(date.strftime("/archive/nations/%Y-%m-%d-regions-xml.gz"))
+    return _REGIONS_DUMP
 
 
 def CardsDump(season: Literal[1, "1", 2, "2", 3, "3"]) -> httpx.URL:
-    return API_URL.join(f"/pages/cardlist_S{season}.xml.gz")
+    key = str(season)
+    url = _CARDS_DUMPS.get(key)
+    if url is None:
+        url = _CARDS_DUMPS[key] = API_URL.join(f"/pages/cardlist_S{key}.xml.gz")
+    return url
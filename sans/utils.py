@@ -1,19 +1,28 @@
 from __future__ import annotations
 
+import os
 import sys
-from contextlib import ExitStack
-from typing import Any, Coroutine, overload
+from typing import Any, Coroutine, Iterator, overload
+from urllib.parse import quote_plus
 from xml.etree import ElementTree as etree
 
 import httpx
 
 from .auth import NSAuth
 from .client import AsyncClient, Client
+from .decoder import GZipDecoder, XMLChunker
 from .errors import PrivateCommandError
 from .response import Response
 from .url import Command
 
-__all__ = ["prepare_and_execute", "indent"]
+try:
+    from lxml.etree import _Element, _ElementTree, indent as _lxml_indent
+
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+__all__ = ["prepare_and_execute", "indent", "iter_dump"]
 
 
 @overload
@@ -39,43 +48,77 @@ def prepare_and_execute(
 ) -> Response | Coroutine[Any, Any, Response]:
     if isinstance(client, httpx.AsyncClient):
         return _prepare_async(client, auth, nation, c, **parameters)
-    with ExitStack() as stack:
-        if not client:
-            client = stack.enter_context(Client())
-        parameters.update(mode="prepare")
-        url = Command(nation, c, **parameters)
-        response = client.get(url, auth=auth)
-        response.raise_for_status()
-        error = response.xml.findtext("ERROR", default="")
-        if error:
-            raise PrivateCommandError(error, response=response)
-        token = response.xml.findtext("SUCCESS", default="")
-        parameters.update(mode="execute", token=token)
-        url = Command(nation, c, **parameters, mode="execute", token=token)
-        return client.get(url, auth=auth)
-    # pyright incorrectly believes this line is reachable
-    assert False  # noqa: B011
+    if not client:
+        with Client() as client:
+            return _prepare_sync(client, auth, nation, c, **parameters)
+    return _prepare_sync(client, auth, nation, c, **parameters)
+
+
+def _prepare_sync(
+    client: Client, auth: NSAuth, nation: str, c: str, **parameters: str
+) -> Response:
+    prepare_url, execute_url = _command_urls(nation, c, parameters)
+    response = client.get(prepare_url, auth=auth)
+    response.raise_for_status()
+    error = response.xml.findtext("ERROR", default="")
+    if error:
+        raise PrivateCommandError(error, response=response)
+    token = response.xml.findtext("SUCCESS", default="")
+    return client.get(execute_url + quote_plus(token), auth=auth)
 
 
 async def _prepare_async(
     client: AsyncClient, auth: NSAuth, nation: str, c: str, **parameters: str
 ) -> Response:
-    parameters.update(mode="prepare")
-    url = Command(nation, c, **parameters)
-    response = await client.get(url, auth=auth)
+    prepare_url, execute_url = _command_urls(nation, c, parameters)
+    response = await client.get(prepare_url, auth=auth)
     response.raise_for_status()
     error = response.xml.findtext("ERROR", default="")
     if error:
         raise PrivateCommandError(error, response=response)
     token = response.xml.findtext("SUCCESS", default="")
-    parameters.update(mode="execute", token=token)
-    url = Command(nation, c, **parameters)
-    return await client.get(url, auth=auth)
+    return await client.get(execute_url + quote_plus(token), auth=auth)
+
+
+def _command_urls(nation: str, c: str, parameters: dict[str, str]) -> tuple[str, str]:
+    # Both steps share every parameter except mode and token,
+    # so only build the common query once.
+    parameters.pop("mode", None)
+    parameters.pop("token", None)
+    url = str(Command(nation, c, **parameters))
+    return f"{url}&mode=prepare", f"{url}&mode=execute&token="
+
+
+def iter_dump(
+    file: str | os.PathLike[str], *, chunk_size: int = 1 << 20
+) -> Iterator[etree.Element]:
+    """
+    Iterates over the top-level elements of a local XML file,
+    such as a previously downloaded :func:`NationsDump` or :func:`RegionsDump`,
+    gunzipping it on the fly if it's compressed.
+
+    Each element is cleared from the tree once the next one is read,
+    so memory use stays flat regardless of the size of the file.
+    """
+    decoder = XMLChunker()
+    with open(file, "rb") as f:
+        chunk = f.read(chunk_size)
+        if chunk[:2] == b"\x1f\x8b":
+            gzip = GZipDecoder()
+            while chunk:
+                yield from decoder.decode(gzip.decode(chunk))
+                chunk = f.read(chunk_size)
+            yield from decoder.decode(gzip.flush())
+        else:
+            while chunk:
+                yield from decoder.decode(chunk)
+                chunk = f.read(chunk_size)
+    yield from decoder.flush()
 
 
 if sys.version_info < (3, 9):
     # from: https://github.com/python/cpython/blob/3.11/Lib/xml/etree/ElementTree.py#L1154
-    def indent(
+    def _etree_indent(
         tree: etree.Element | etree.ElementTree, space: str = "  ", level: int = 0
     ):
         if isinstance(tree, etree.ElementTree):
@@ -88,7 +131,10 @@ if sys.version_info < (3, 9):
         # Reduce the memory consumption by reusing indentation strings.
         indentations = ["\n" + level * space]
 
-        def _indent_children(elem: etree.Element, level: int):
+        # Walk the tree with an explicit stack instead of recursing per element.
+        stack: list[tuple[etree.Element, int]] = [(tree, 0)]
+        while stack:
+            elem, level = stack.pop()
             # Start a new indentation level for the first child.
             child_level = level + 1
             try:
@@ -102,7 +148,7 @@ if sys.version_info < (3, 9):
 
             for child in elem:
                 if len(child):
-                    _indent_children(child, child_level)
+                    stack.append((child, child_level))
                 if not child.tail or not child.tail.strip():
                     child.tail = child_indentation
 
@@ -110,7 +156,21 @@ if sys.version_info < (3, 9):
             if not child.tail.strip():  # type: ignore
                 child.tail = indentations[level]  # type: ignore
 
-        _indent_children(tree, 0)
-
 else:
-    from xml.etree.ElementTree import indent
+    from xml.etree.ElementTree import indent as _etree_indent
+
+
+def indent(
+    tree: etree.Element | etree.ElementTree | _Element | _ElementTree,
+    space: str = "  ",
+    level: int = 0,
+) -> None:
+    """
+    Indents an XML tree in-place for pretty-printing,
+    like :func:`xml.etree.ElementTree.indent`.
+
+    lxml trees are handed to lxml's own C implementation.
+    """
+    if HAS_LXML and isinstance(tree, (_Element, _ElementTree)):
+        return _lxml_indent(tree, space, level=level)
+    return _etree_indent(tree, space, level)  # type: ignore